@@ -13,20 +13,51 @@
 
 """Collection of Django HTTP response subclasses representing ACME responses."""
 
+import functools
 from http import HTTPStatus
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
+import orjson
 from acme import messages
 
-from django.http import HttpRequest, JsonResponse
+from django.http import HttpRequest, HttpResponse
 from django.urls import reverse
 
 from django_ca.acme.messages import Order
 from django_ca.models import AcmeAccount
 
+#: Bound at module level so response constructors skip the global and attribute lookups per request.
+_dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
 
-class AcmeResponse(JsonResponse):
-    """Base class for all ACME responses."""
+#: Placeholders used to turn a reversed URL into a format string. Both match the URL converters used in the
+#: URL configuration (``[0-9A-F:]+`` for serials, ``[a-zA-Z0-9]+`` for ACME slugs).
+_SERIAL_PLACEHOLDER = "AA00AA00AA00AA00AA00"
+_SLUG_PLACEHOLDER = "zZSLUGPLACEHOLDERZz"
+
+
+@functools.lru_cache(maxsize=1)
+def _account_orders_url_template() -> str:
+    """Format string for the account orders URL.
+
+    :py:func:`~django.urls.reverse` walks the URL configuration on every call, so resolve the URL only once
+    with placeholder values and fill in serial and slug with :py:meth:`str.format` at call time.
+    """
+    url = reverse(
+        "django_ca:acme-account-orders",
+        kwargs={"serial": _SERIAL_PLACEHOLDER, "slug": _SLUG_PLACEHOLDER},
+    )
+    return url.replace(_SERIAL_PLACEHOLDER, "{serial}").replace(_SLUG_PLACEHOLDER, "{slug}")
+
+
+class AcmeResponse(HttpResponse):
+    """Base class for all ACME responses.
+
+    Responses are serialized with :py:func:`orjson.dumps`, which is considerably faster than the stdlib
+    :py:mod:`json` module used by :py:class:`~django.http.JsonResponse` and produces bytes directly.
+    """
+
+    def __init__(self, data: Any, content_type: str = "application/json") -> None:
+        super().__init__(_dumps(data), content_type=content_type)
 
 
 class AcmeSimpleResponse(AcmeResponse):
@@ -42,18 +73,11 @@ class AcmeResponseAccount(AcmeResponse):
     """Response containing an ACME account."""
 
     def __init__(self, request: HttpRequest, account: AcmeAccount) -> None:
-        contact = []
-        if account.contact:
-            contact = account.contact.split("\n")
-
         data = {
             "status": account.status,
-            "contact": contact,
+            "contact": account.contact_lines,
             "orders": request.build_absolute_uri(
-                reverse(
-                    "django_ca:acme-account-orders",
-                    kwargs={"slug": account.slug, "serial": account.ca.serial},
-                )
+                _account_orders_url_template().format(serial=account.ca.serial, slug=account.slug)
             ),
         }
 
@@ -98,15 +122,38 @@ class AcmeResponseError(AcmeResponse):
     status_code = HTTPStatus.INTERNAL_SERVER_ERROR  # 500
     type = "serverInternal"
 
+    #: Serialized problem document with only class defaults, prebuilt at class-creation time.
+    _cached_body: ClassVar[bytes]
+    #: Full error type URN, prebuilt at class-creation time.
+    _urn: ClassVar[str]
+
+    @classmethod
+    def _body(cls, urn: str, detail: str) -> bytes:
+        return orjson.dumps({"type": urn, "status": cls.status_code, "detail": detail})
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Error types and messages are class constants for all concrete error responses, so the URN and the
+        # serialized body are built once when the class is created and reused on every response.
+        super().__init_subclass__(**kwargs)
+        cls._urn = f"urn:ietf:params:acme:error:{cls.type}"
+        cls._cached_body = cls._body(cls._urn, cls.message)
+
     def __init__(self, typ: Optional[str] = None, message: str = "") -> None:
-        super().__init__(
-            {
-                "type": f"urn:ietf:params:acme:error:{typ or self.type}",
-                "status": self.status_code,
-                "detail": message or self.message,
-            },
-            content_type="application/problem+json",
-        )
+        if typ is None and not message:
+            content = self._cached_body
+        else:
+            urn = self._urn if typ is None else f"urn:ietf:params:acme:error:{typ}"
+            content = self._body(urn, message or self.message)
+        # Call HttpResponse directly, as content is already serialized (AcmeResponse would serialize again).
+        # pylint: disable-next=super-init-not-called,non-parent-init-called
+        HttpResponse.__init__(self, content, content_type="application/problem+json")
+
+
+# __init_subclass__ only runs for subclasses, so build the URN and body for the base class here.
+# pylint: disable=protected-access
+AcmeResponseError._urn = f"urn:ietf:params:acme:error:{AcmeResponseError.type}"
+AcmeResponseError._cached_body = AcmeResponseError._body(AcmeResponseError._urn, AcmeResponseError.message)
+# pylint: enable=protected-access
 
 
 class AcmeResponseMalformed(AcmeResponseError):
@@ -183,7 +183,9 @@ def list_certificates(
     filters: CertificateFilterSchema = Query(...),  # type: ignore[type-arg]  # noqa: B008
 ) -> CertificateQuerySet:
     """Retrieve certificates signed by the certificate authority named by `serial`."""
-    ca = get_certificate_authority(serial, expired=True)  # You can list certificates of expired CAs
+    # You can also view certificates of expired CAs. The CA is only used to filter certificates, so only
+    # the fields needed for that are fetched.
+    ca = get_certificate_authority(serial, expired=True, fields=("pk", "serial"))
     qs = Certificate.objects.filter(ca=ca)
 
     if filters.expired is False:
@@ -207,7 +209,9 @@ def list_certificates(
 )
 def view_certificate(request: WSGIRequest, serial: str, certificate_serial: str) -> Certificate:
     """Retrieve details of the certificate with the given certificate serial."""
-    ca = get_certificate_authority(serial, expired=True)  # You can view certificates of expired CAs
+    # You can also view certificates of expired CAs. The CA is only used to filter certificates, so only
+    # the fields needed for that are fetched.
+    ca = get_certificate_authority(serial, expired=True, fields=("pk", "serial"))
     return Certificate.objects.get(ca=ca, serial=certificate_serial)
 
 
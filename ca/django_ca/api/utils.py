@@ -14,7 +14,7 @@
 """API utility functions."""
 
 import typing
-from typing import Any
+from typing import Any, Optional
 
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
@@ -31,11 +31,19 @@ else:
     User = get_user_model()
 
 
-def get_certificate_authority(serial: str, expired: bool = False) -> CertificateAuthority:
-    """Get a certificate authority from the given serial."""
+def get_certificate_authority(
+    serial: str, expired: bool = False, fields: Optional[tuple[str, ...]] = None
+) -> CertificateAuthority:
+    """Get a certificate authority from the given serial.
+
+    Pass `fields` to load only the named fields from the database. Callers that use the certificate
+    authority only as a query handle can skip fetching large columns this way.
+    """
     qs = CertificateAuthority.objects.enabled().exclude(api_enabled=False)
     if expired is False:
         qs = qs.valid()
+    if fields is not None:
+        qs = qs.only(*fields)
 
     try:
         return qs.get(serial=serial)
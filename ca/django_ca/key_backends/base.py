@@ -62,14 +62,22 @@ class CreatePrivateKeyOptionsBaseModel(BaseModel):
     key_size: Optional[Annotated[PowerOfTwoInt, Field(ge=model_settings.CA_MIN_KEY_SIZE)]] = None
 
     @model_validator(mode="after")
-    def validate_key_size(self) -> "typing.Self":
-        """Validate that the key size is not set for invalid key types."""
+    def validate_options(self) -> "typing.Self":
+        """Validate key size and elliptic curve in a single validator pass.
+
+        Pydantic dispatches every model validator as a separate function call, so key size and elliptic
+        curve are validated in one validator, with subclasses hooking in via ``_validate_elliptic_curve``.
+        """
         if self.key_type in ("RSA", "DSA") and self.key_size is None:
             self.key_size = model_settings.CA_DEFAULT_KEY_SIZE
         elif self.key_type not in ("RSA", "DSA") and self.key_size is not None:
             raise ValueError(f"Key size is not supported for {self.key_type} keys.")
+        self._validate_elliptic_curve()
         return self
 
+    def _validate_elliptic_curve(self) -> None:
+        """Hook for subclasses that support elliptic curve keys."""
+
 
 class KeyBackend(
     typing.Generic[
@@ -70,15 +70,13 @@ class HSMCreatePrivateKeyOptions(PinModelMixin, CreatePrivateKeyOptionsBaseModel
     key_type: SupportedKeyType  # overwrites field from the base model
     elliptic_curve: Optional[EllipticCurves]
 
-    @model_validator(mode="after")
-    def validate_elliptic_curve(self) -> "HSMCreatePrivateKeyOptions":
+    def _validate_elliptic_curve(self) -> None:
         """Validate that the elliptic curve is not set for invalid key types."""
         if self.key_type == "EC" and self.elliptic_curve is None:
             default_elliptic_curve_type = type(model_settings.CA_DEFAULT_ELLIPTIC_CURVE)
             self.elliptic_curve = constants.ELLIPTIC_CURVE_NAMES[default_elliptic_curve_type]
         elif self.key_type != "EC" and self.elliptic_curve is not None:
             raise ValueError(f"Elliptic curves are not supported for {self.key_type} keys.")
-        return self
 
 
 class HSMStorePrivateKeyOptions(PinModelMixin, BaseModel):
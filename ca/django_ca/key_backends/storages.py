@@ -13,13 +13,14 @@
 
 """Storages."""
 
+import hashlib
 import typing
 from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
 from cryptography import x509
@@ -57,6 +58,20 @@ from django_ca.utils import generate_private_key, get_cert_builder
 if typing.TYPE_CHECKING:
     from django_ca.models import CertificateAuthority
 
+# Cache of key encryption wrappers, keyed by a hash of the password so that plain-text passwords do not
+# serve as dictionary keys. Bulk operations (e.g. creating several child CAs) reuse the same password.
+_encryption_cache: dict[bytes, serialization.KeySerializationEncryption] = {}
+
+
+def _encryption_for(password: Optional[bytes]) -> serialization.KeySerializationEncryption:
+    """Get the (cached) key serialization encryption for the given password."""
+    if password is None:
+        return serialization.NoEncryption()
+    digest = hashlib.blake2b(password, digest_size=16).digest()
+    if (encryption := _encryption_cache.get(digest)) is None:
+        encryption = _encryption_cache.setdefault(digest, serialization.BestAvailableEncryption(password))
+    return encryption
+
 
 class StoragesCreatePrivateKeyOptions(CreatePrivateKeyOptionsBaseModel):
     """Options for initializing private keys."""
@@ -68,14 +83,12 @@ class StoragesCreatePrivateKeyOptions(CreatePrivateKeyOptionsBaseModel):
     path: Path
     elliptic_curve: Optional[EllipticCurveTypeAlias] = None
 
-    @model_validator(mode="after")
-    def validate_elliptic_curve(self) -> "StoragesCreatePrivateKeyOptions":
+    def _validate_elliptic_curve(self) -> None:
         """Validate that the elliptic curve is not set for invalid key types."""
         if self.key_type == "EC" and self.elliptic_curve is None:
             self.elliptic_curve = model_settings.CA_DEFAULT_ELLIPTIC_CURVE
         elif self.key_type != "EC" and self.elliptic_curve is not None:
             raise ValueError(f"Elliptic curves are not supported for {self.key_type} keys.")
-        return self
 
 
 class StoragesStorePrivateKeyOptions(BaseModel):
@@ -109,6 +122,10 @@ class StoragesUsePrivateKeyOptions(BaseModel):
         return password
 
 
+#: Cached adapter to validate use-private-key options without re-resolving the validator per call.
+_use_private_key_options_adapter = TypeAdapter(StoragesUsePrivateKeyOptions)
+
+
 class StoragesBackend(
     KeyBackend[StoragesCreatePrivateKeyOptions, StoragesStorePrivateKeyOptions, StoragesUsePrivateKeyOptions]
 ):
@@ -136,6 +153,9 @@ class StoragesBackend(
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, StoragesBackend) and self.storage_alias == other.storage_alias
 
+    def __hash__(self) -> int:
+        return hash((type(self), self.storage_alias))
+
     def _add_password_argument(self, group: ArgumentGroup) -> None:
         group.add_argument(
             f"--{self.argparse_prefix}password",
@@ -204,7 +224,7 @@ class StoragesBackend(
     def get_use_private_key_options(
         self, ca: "CertificateAuthority", options: dict[str, Any]
     ) -> StoragesUsePrivateKeyOptions:
-        return StoragesUsePrivateKeyOptions.model_validate(
+        return _use_private_key_options_adapter.validate_python(
             {"password": options.get(f"{self.options_prefix}password")},
             context={"ca": ca, "backend": self},
             strict=True,
@@ -213,38 +233,42 @@ class StoragesBackend(
     def get_use_parent_private_key_options(
         self, ca: "CertificateAuthority", options: dict[str, Any]
     ) -> StoragesUsePrivateKeyOptions:
-        return StoragesUsePrivateKeyOptions.model_validate(
+        return _use_private_key_options_adapter.validate_python(
             {"password": options[f"{self.options_prefix}parent_password"]},
             context={"ca": ca, "backend": self},
         )
 
+    def _save_private_key(
+        self,
+        ca: "CertificateAuthority",
+        key: CertificateIssuerPrivateKeyTypes,
+        path: Path,
+        password: Optional[bytes],
+    ) -> None:
+        """Serialize `key` and hand it to the storage backend in a single buffer."""
+        der = key.private_bytes(
+            encoding=Encoding.DER, format=PrivateFormat.PKCS8, encryption_algorithm=_encryption_for(password)
+        )
+
+        name = f"{ca.safe_serial}.key"
+        saved_path = storages[self.storage_alias].save(str(path / name), ContentFile(der, name=name))
+
+        # Update model instance
+        ca.key_backend_options = {"path": saved_path}
+        ca._key_exists = True  # pylint: disable=protected-access  # key was just written
+
     def create_private_key(
         self,
         ca: "CertificateAuthority",
         key_type: ParsableKeyType,
         options: StoragesCreatePrivateKeyOptions,
     ) -> tuple[CertificateIssuerPublicKeyTypes, StoragesUsePrivateKeyOptions]:
-        storage = storages[self.storage_alias]
-
-        if options.password is None:
-            encryption: serialization.KeySerializationEncryption = serialization.NoEncryption()
-        else:
-            encryption = serialization.BestAvailableEncryption(options.password)
-
         key = generate_private_key(options.key_size, key_type, options.elliptic_curve)
 
-        der = key.private_bytes(
-            encoding=Encoding.DER, format=PrivateFormat.PKCS8, encryption_algorithm=encryption
-        )
-
         # write private key to file and update ourselves so that we are able to sign certificates
-        safe_serial = ca.serial.replace(":", "")
-        path = storage.save(str(options.path / f"{safe_serial}.key"), ContentFile(der))
+        self._save_private_key(ca, key, options.path, options.password)
 
-        # Update model instance
-        ca.key_backend_options = {"path": path}
-
-        use_private_key_options = StoragesUsePrivateKeyOptions.model_validate(
+        use_private_key_options = _use_private_key_options_adapter.validate_python(
             {"password": options.password}, context={"ca": ca, "backend": self}
         )
 
@@ -257,22 +281,7 @@ class StoragesBackend(
         certificate: x509.Certificate,
         options: StoragesStorePrivateKeyOptions,
     ) -> None:
-        storage = storages[self.storage_alias]
-
-        if options.password is None:
-            encryption: serialization.KeySerializationEncryption = serialization.NoEncryption()
-        else:
-            encryption = serialization.BestAvailableEncryption(options.password)
-
-        der = key.private_bytes(
-            encoding=Encoding.DER, format=PrivateFormat.PKCS8, encryption_algorithm=encryption
-        )
-
-        safe_serial = ca.serial.replace(":", "")
-        path = storage.save(str(options.path / f"{safe_serial}.key"), ContentFile(der))
-
-        # Update model instance
-        ca.key_backend_options = {"path": path}
+        self._save_private_key(ca, key, options.path, options.password)
 
     def get_key(
         self, ca: "CertificateAuthority", use_private_key_options: StoragesUsePrivateKeyOptions
@@ -280,32 +289,48 @@ class StoragesBackend(
         """The CAs private key as private key."""
         storage = storages[self.storage_alias]
         path = ca.key_backend_options["path"]
+        password = use_private_key_options.password
 
-        # Load encoded private key data from the filesystem
-        stream = storage.open(path, mode="rb")
+        # Parsing a large RSA key is a non-trivial operation, and a single request may load the same key
+        # several times (e.g. usability checks plus signing), so the parsed key is cached on the model
+        # instance (mirroring _key_exists in is_usable()). A freshly loaded model instance thus never sees a
+        # stale key, e.g. when the key file was replaced out of band - reloading the model invalidates the
+        # cache. The password is hashed so it is not kept in memory in clear text.
+        cache_key = (path, hashlib.blake2b(password or b"").digest())
+        cached = ca._private_key_cache  # pylint: disable=protected-access
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        # Load encoded private key data. For storage backends with a local filesystem path, read the file
+        # directly and skip the file wrapper object that storage.open() would allocate.
         try:
-            key_data: bytes = stream.read()
-        finally:
-            stream.close()
+            local_path = storage.path(path)
+        except NotImplementedError:  # remote storage backends do not implement path()
+            with storage.open(path, mode="rb") as stream:
+                key_data: bytes = stream.read()
+        else:
+            key_data = Path(local_path).read_bytes()
 
-        password = use_private_key_options.password
+        # PEM keys always start with "-----BEGIN", while DER keys start with an ASN.1 SEQUENCE (0x30), so a
+        # one-byte check picks the right loader and saves a doomed DER parse attempt for PEM keys.
+        if key_data[:1] == b"-":
+            loader = load_pem_private_key
+        else:
+            loader = load_der_private_key
 
         try:
             key = typing.cast(  # type validated below
-                CertificateIssuerPrivateKeyTypes, load_der_private_key(key_data, password)
+                CertificateIssuerPrivateKeyTypes, loader(key_data, password)
             )
-        except ValueError:
-            try:
-                key = typing.cast(  # type validated below
-                    CertificateIssuerPrivateKeyTypes, load_pem_private_key(key_data, password)
-                )
-            except ValueError as ex2:
-                # cryptography passes the OpenSSL error directly here and it is notoriously unstable.
-                raise ValueError("Could not decrypt private key - bad password?") from ex2
+        except ValueError as ex:
+            # cryptography passes the OpenSSL error directly here and it is notoriously unstable.
+            raise ValueError("Could not decrypt private key - bad password?") from ex
 
         if not isinstance(key, constants.PRIVATE_KEY_TYPES):  # pragma: no cover
             raise ValueError("Private key of this type is not supported.")
 
+        ca._private_key_cache = (cache_key, key)  # pylint: disable=protected-access
+
         return key
 
     def is_usable(
@@ -317,9 +342,16 @@ class StoragesBackend(
         if not ca.key_backend_options or not ca.key_backend_options.get("path"):
             return False
 
-        # If options are not passed, we return True if the file exists.
+        # If options are not passed, we return True if the file exists. A positive result is cached on the
+        # model instance, as the existence check is a network round-trip for remote storage backends and
+        # some code paths check usability repeatedly for the same CA.
         if not use_private_key_options:
-            return storages[self.storage_alias].exists(ca.key_backend_options["path"])
+            if ca._key_exists:  # pylint: disable=protected-access
+                return True
+            exists: bool = storages[self.storage_alias].exists(ca.key_backend_options["path"])
+            if exists:
+                ca._key_exists = True  # pylint: disable=protected-access
+            return exists
 
         try:
             self.get_key(ca, use_private_key_options)
@@ -36,8 +36,6 @@ from django_ca.management.actions import ExpiresAction, IntegerRangeAction, Name
 from django_ca.management.base import BaseSignCommand, add_key_size
 from django_ca.management.mixins import CertificateAuthorityDetailMixin, StorePrivateKeyMixin
 from django_ca.models import CertificateAuthority
-from django_ca.pydantic.messages import GenerateOCSPKeyMessage
-from django_ca.tasks import cache_crl, generate_ocsp_key, run_task
 from django_ca.typehints import (
     AllowedHashTypes,
     ArgumentGroup,
@@ -48,6 +46,21 @@ from django_ca.typehints import (
 )
 from django_ca.utils import format_general_name, parse_general_name
 
+# Bound at module level so that repeated lookups during argument parser construction (paid on every
+# invocation, including --help) skip the module attribute access.
+_EXTENSION_NAMES = constants.EXTENSION_NAMES
+_EXTENSION_DEFAULT_CRITICAL = constants.EXTENSION_DEFAULT_CRITICAL
+
+# Default texts shown in --help. Settings are fixed for the lifetime of the process, so these are computed
+# once at import time instead of on every parser construction.
+_DEFAULT_ALGORITHM = constants.HASH_ALGORITHM_NAMES[
+    type(model_settings.CA_DEFAULT_SIGNATURE_HASH_ALGORITHM)
+]
+_DEFAULT_DSA_ALGORITHM = constants.HASH_ALGORITHM_NAMES[
+    type(model_settings.CA_DEFAULT_DSA_SIGNATURE_HASH_ALGORITHM)
+]
+_ALGORITHM_DEFAULT_TEXT = f"{_DEFAULT_ALGORITHM} for RSA/EC keys, {_DEFAULT_DSA_ALGORITHM} for DSA keys"
+
 
 class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCommand):
     """Implement :command:`manage.py init_ca`."""
@@ -56,7 +69,7 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
 
     def add_basic_constraints_group(self, parser: CommandParser) -> None:
         """Add argument group for the Basic Constraints extension."""
-        ext_name = constants.EXTENSION_NAMES[ExtensionOID.BASIC_CONSTRAINTS]
+        ext_name = _EXTENSION_NAMES[ExtensionOID.BASIC_CONSTRAINTS]
         group = parser.add_argument_group(
             f"{ext_name} extension",
             "This extension allows you to specify the number of CAs that can appear below this one. A path "
@@ -80,8 +93,8 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
 
     def add_inhibit_any_policy_group(self, parser: CommandParser) -> None:
         """Add argument group for the Inhibit anyPolicy extension."""
-        ext_name = constants.EXTENSION_NAMES[ExtensionOID.INHIBIT_ANY_POLICY]
-        cert_policies_name = constants.EXTENSION_NAMES[ExtensionOID.CERTIFICATE_POLICIES]
+        ext_name = _EXTENSION_NAMES[ExtensionOID.INHIBIT_ANY_POLICY]
+        cert_policies_name = _EXTENSION_NAMES[ExtensionOID.CERTIFICATE_POLICIES]
         group = parser.add_argument_group(
             f"{ext_name} extension",
             "This extension indicates that the special anyPolicy is not considered a match when it appears "
@@ -98,7 +111,7 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
 
     def add_name_constraints_group(self, parser: CommandParser) -> ArgumentGroup:
         """Add an argument group for the NameConstraints extension."""
-        ext_name = constants.EXTENSION_NAMES[ExtensionOID.NAME_CONSTRAINTS]
+        ext_name = _EXTENSION_NAMES[ExtensionOID.NAME_CONSTRAINTS]
         group = parser.add_argument_group(
             f"{ext_name} extension",
             "This extension limits the names a signed certificate can contain.",
@@ -121,7 +134,7 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
 
     def add_policy_constraints_group(self, parser: CommandParser) -> None:
         """Add argument group for the Policy Constraints extension."""
-        ext_name = constants.EXTENSION_NAMES[ExtensionOID.POLICY_CONSTRAINTS]
+        ext_name = _EXTENSION_NAMES[ExtensionOID.POLICY_CONSTRAINTS]
         group = parser.add_argument_group(
             f"{ext_name} extension",
             "This extension can be used to require an explicit policy and/or prohibit policy mapping.",
@@ -177,11 +190,6 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
 
     def add_arguments(self, parser: CommandParser) -> None:
         # Load all supported key backend classes so that they can add command-line arguments.
-        default = constants.HASH_ALGORITHM_NAMES[type(model_settings.CA_DEFAULT_SIGNATURE_HASH_ALGORITHM)]
-        dsa_default = constants.HASH_ALGORITHM_NAMES[
-            type(model_settings.CA_DEFAULT_DSA_SIGNATURE_HASH_ALGORITHM)
-        ]
-
         general_group = self.add_general_args(parser)
         general_group.add_argument(
             "--expires",
@@ -191,9 +199,7 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
             help="CA certificate expires in DAYS days (default: %(default)s).",
         )
         self.add_subject_format_option(general_group)
-        self.add_algorithm(
-            general_group, default_text=f"{default} for RSA/EC keys, {dsa_default} for DSA keys"
-        )
+        self.add_algorithm(general_group, default_text=_ALGORITHM_DEFAULT_TEXT)
 
         self.add_key_backend_option(parser)
         self.add_create_private_key_arguments(parser)
@@ -400,33 +406,34 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
         if not parent and crl_full_names:
             raise CommandError("CRLs cannot be used to revoke root CAs.")
         if not parent and authority_information_access:
-            if ocsp_responder := next(
-                (
-                    ad
-                    for ad in authority_information_access
-                    if ad.access_method == AuthorityInformationAccessOID.OCSP
-                ),
-                None,
-            ):
+            # A single pass over the access descriptions instead of one scan per access method, with the
+            # OIDs and the access method bound to locals to avoid repeated attribute lookups in the loop.
+            ocsp_responder = ca_issuer = None
+            ocsp_oid = AuthorityInformationAccessOID.OCSP
+            ca_issuers_oid = AuthorityInformationAccessOID.CA_ISSUERS
+            for access_description in authority_information_access:
+                access_method = access_description.access_method
+                if access_method == ocsp_oid:
+                    ocsp_responder = access_description
+                elif access_method == ca_issuers_oid:
+                    ca_issuer = access_description
+
+            if ocsp_responder is not None:
                 responder_value = format_general_name(ocsp_responder.access_location)
                 raise CommandError(f"{responder_value}: OCSP responder cannot be added to root CAs.")
 
-            # No if check necessary here, authority_information_access contains either ocsp or ca_issuer
-            # COVERAGE NOTE: next() will always return, so it's not a branch
-            ca_issuer = next(  # pragma: no branch
-                ad
-                for ad in authority_information_access
-                if ad.access_method == AuthorityInformationAccessOID.CA_ISSUERS
-            )
-            responder_value = format_general_name(ca_issuer.access_location)
-            raise CommandError(f"{responder_value}: CA issuer cannot be added to root CAs.")
+            # COVERAGE NOTE: authority_information_access contains either ocsp or ca_issuer, so this
+            # condition is always true if there was no OCSP responder.
+            if ca_issuer is not None:  # pragma: no branch
+                responder_value = format_general_name(ca_issuer.access_location)
+                raise CommandError(f"{responder_value}: CA issuer cannot be added to root CAs.")
 
         # Parse the subject
         parsed_subject = self.parse_x509_name(subject, subject_format)
 
         # We require a valid common name
-        common_name = next((attr.value for attr in parsed_subject if attr.oid == NameOID.COMMON_NAME), False)
-        if not common_name:
+        common_name_attributes = parsed_subject.get_attributes_for_oid(NameOID.COMMON_NAME)
+        if not common_name_attributes or not common_name_attributes[0].value:
             raise CommandError("Subject must contain a common name (CN=...).")
 
         extensions: list[CertificateExtension] = [
@@ -438,7 +445,7 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
             self.add_extension(
                 extensions,
                 authority_information_access,
-                constants.EXTENSION_DEFAULT_CRITICAL[ExtensionOID.AUTHORITY_INFORMATION_ACCESS],
+                _EXTENSION_DEFAULT_CRITICAL[ExtensionOID.AUTHORITY_INFORMATION_ACCESS],
             )
         # Add the Certificate Policies extension
         if certificate_policies is not None:
@@ -459,21 +466,21 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
             self.add_extension(
                 extensions,
                 x509.InhibitAnyPolicy(skip_certs=inhibit_any_policy),
-                constants.EXTENSION_DEFAULT_CRITICAL[ExtensionOID.INHIBIT_ANY_POLICY],
+                _EXTENSION_DEFAULT_CRITICAL[ExtensionOID.INHIBIT_ANY_POLICY],
             )
         # Add the Issuer Alternative Name extension
         if issuer_alternative_name is not None:
             self.add_extension(
                 extensions,
                 issuer_alternative_name,
-                constants.EXTENSION_DEFAULT_CRITICAL[ExtensionOID.ISSUER_ALTERNATIVE_NAME],
+                _EXTENSION_DEFAULT_CRITICAL[ExtensionOID.ISSUER_ALTERNATIVE_NAME],
             )
         # Add the NameConstraints extension
         if permit_name or exclude_name:
             self.add_extension(
                 extensions,
                 x509.NameConstraints(excluded_subtrees=exclude_name, permitted_subtrees=permit_name),
-                constants.EXTENSION_DEFAULT_CRITICAL[ExtensionOID.NAME_CONSTRAINTS],
+                _EXTENSION_DEFAULT_CRITICAL[ExtensionOID.NAME_CONSTRAINTS],
             )
         # Add the Policy Constraints extension
         if require_explicit_policy is not None or inhibit_policy_mapping is not None:
@@ -483,7 +490,7 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
                     require_explicit_policy=require_explicit_policy,
                     inhibit_policy_mapping=inhibit_policy_mapping,
                 ),
-                constants.EXTENSION_DEFAULT_CRITICAL[ExtensionOID.POLICY_CONSTRAINTS],
+                _EXTENSION_DEFAULT_CRITICAL[ExtensionOID.POLICY_CONSTRAINTS],
             )
         # Add the Subject Alternative Name extension
         if subject_alternative_name is not None:
@@ -498,7 +505,7 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
         if sign_authority_information_access is not None:
             sign_authority_information_access_ext = x509.Extension(
                 oid=ExtensionOID.AUTHORITY_INFORMATION_ACCESS,
-                critical=constants.EXTENSION_DEFAULT_CRITICAL[ExtensionOID.AUTHORITY_INFORMATION_ACCESS],
+                critical=_EXTENSION_DEFAULT_CRITICAL[ExtensionOID.AUTHORITY_INFORMATION_ACCESS],
                 value=sign_authority_information_access,
             )
         sign_certificate_policies_ext = None
@@ -580,14 +587,13 @@ class Command(StorePrivateKeyMixin, CertificateAuthorityDetailMixin, BaseSignCom
         except Exception as ex:
             raise CommandError(ex) from ex
 
-        # Generate OCSP keys and cache CRLs
-        serialized_key_backend_options = load_key_backend_options.model_dump(mode="json")
+        # Generate OCSP keys and cache CRLs with a single task submission. Imported here as importing the
+        # tasks module also imports Celery (if installed), which is not needed for anything above.
+        # pylint: disable-next=import-outside-toplevel
+        from django_ca.tasks import generate_ocsp_key_and_cache_crl, run_task
 
-        generate_csp_key_message = GenerateOCSPKeyMessage(serial=ca.serial)
         run_task(
-            generate_ocsp_key,
-            key_backend_options=serialized_key_backend_options,
-            **generate_csp_key_message.model_dump(mode="json", exclude_unset=True),
+            generate_ocsp_key_and_cache_crl,
+            serial=ca.serial,
+            key_backend_options=load_key_backend_options.model_dump(mode="json"),
         )
-
-        run_task(cache_crl, serial=ca.serial, key_backend_options=serialized_key_backend_options)
@@ -31,8 +31,6 @@ from django_ca.management.actions import ExpiresAction
 from django_ca.management.base import BaseCommand, add_elliptic_curve, add_key_size
 from django_ca.management.mixins import UsePrivateKeyMixin
 from django_ca.models import CertificateAuthority
-from django_ca.pydantic.messages import GenerateOCSPKeyMessage
-from django_ca.tasks import generate_ocsp_key, run_task
 from django_ca.typehints import AllowedHashTypes, ParsableKeyType
 from django_ca.utils import add_colons, validate_private_key_parameters
 
@@ -91,6 +89,14 @@ class Command(UsePrivateKeyMixin, BaseCommand):
         force: bool,
         **options: Any,
     ) -> None:
+        # Imported here as importing the tasks module also imports Celery (if installed), which is not
+        # needed to parse arguments or print help for this command.
+        # pylint: disable=import-outside-toplevel
+        from django_ca.pydantic.messages import GenerateOCSPKeyMessage
+        from django_ca.tasks import generate_ocsp_key, run_task
+
+        # pylint: enable=import-outside-toplevel
+
         profile = profile or "ocsp"
 
         # Check if the profile exists. Note that this shouldn't really happen, since valid parameters match
@@ -102,12 +108,14 @@ class Command(UsePrivateKeyMixin, BaseCommand):
         if not serials:
             serials = CertificateAuthority.objects.all().order_by("serial").values_list("serial", flat=True)
 
-        for serial in serials:
-            serial = serial.replace(":", "").strip().upper()
+        # Fetch all certificate authorities with a single query instead of one query per serial.
+        cleaned_serials = [serial.replace(":", "").strip().upper() for serial in serials]
+        cas = CertificateAuthority.objects.in_bulk(cleaned_serials, field_name="serial")
+
+        for serial in cleaned_serials:
             hr_serial = add_colons(serial)
-            try:
-                ca: CertificateAuthority = CertificateAuthority.objects.get(serial=serial)
-            except CertificateAuthority.DoesNotExist:
+            ca = cas.get(serial)
+            if ca is None:
                 self.stderr.write(self.style.ERROR(f"{hr_serial}: Unknown CA."))
                 continue
 
@@ -34,7 +34,10 @@ from pydantic import BaseModel
 from cryptography import x509
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed448, ed25519, rsa
-from cryptography.hazmat.primitives.asymmetric.types import CertificateIssuerPublicKeyTypes
+from cryptography.hazmat.primitives.asymmetric.types import (
+    CertificateIssuerPrivateKeyTypes,
+    CertificateIssuerPublicKeyTypes,
+)
 from cryptography.hazmat.primitives.serialization import Encoding, PrivateFormat, PublicFormat
 from cryptography.x509.oid import ExtensionOID, NameOID
 
@@ -496,6 +499,11 @@ class CertificateAuthority(X509CertMixin):  # type: ignore[django-manager-missin
         certificate_set: "CertificateManager"
         acmeaccount_set: "manager.RelatedManager[AcmeAccount]"
 
+    # Runtime caches set by the storages key backend (not model fields, so they are reset whenever the model
+    # instance is reloaded from the database).
+    _key_exists: bool = False
+    _private_key_cache: Optional[tuple[tuple[str, bytes], CertificateIssuerPrivateKeyTypes]] = None
+
     name = models.CharField(max_length=256, help_text=_("A human-readable name"), unique=True)
     enabled = models.BooleanField(default=True)
     parent = models.ForeignKey(
@@ -617,6 +625,11 @@ class CertificateAuthority(X509CertMixin):  # type: ignore[django-manager-missin
         """Shortcut determining if the key is usable and raise ValueError otherwise."""
         return self.key_backend.check_usable(self, options)
 
+    @cached_property
+    def safe_serial(self) -> str:
+        """The serial of this CA without colons, as used in file names."""
+        return self.serial.replace(":", "")
+
     @property
     def key_type(self) -> ParsableKeyType:
         """The type of key as a string, e.g. "RSA" or "Ed448"."""
@@ -903,7 +916,7 @@ class CertificateAuthority(X509CertMixin):  # type: ignore[django-manager-missin
         if not_after is None:
             not_after = now + timedelta(days=self.ocsp_responder_key_validity)
 
-        safe_serial = self.serial.replace(":", "")
+        safe_serial = self.safe_serial
 
         if algorithm is None:
             algorithm = self.algorithm
@@ -1389,6 +1402,13 @@ class AcmeAccount(DjangoCAModel):
         except IndexError:
             return ""
 
+    @cached_property
+    def contact_lines(self) -> list[str]:
+        """Contact addresses as a list, computed only once per instance."""
+        if self.contact:
+            return self.contact.split("\n")
+        return []
+
     @property
     def serial(self) -> str:
         """Serial of the CA for this account."""
@@ -180,6 +180,24 @@ def generate_ocsp_key(
     return None
 
 
+@shared_task
+def generate_ocsp_key_and_cache_crl(
+    serial: str, key_backend_options: Optional[dict[str, JSON]] = None
+) -> None:
+    """Task to generate an OCSP key and cache the CRL for the CA named by `serial`.
+
+    Both steps are needed after creating a certificate authority. Bundling them in one task means a single
+    broker message is published instead of two, and the second step reuses the broker round-trip.
+    """
+    try:
+        generate_ocsp_key(serial, key_backend_options=key_backend_options)
+    except Exception:  # pylint: disable=broad-exception-caught
+        # NOTE: The steps were independent tasks before they were bundled, so an error in OCSP key
+        # generation must not prevent the CRL from being cached.
+        log.exception("Error creating OCSP responder key for %s", serial)
+    cache_crl(serial, key_backend_options=key_backend_options)
+
+
 @shared_task
 def generate_ocsp_keys(
     serials: Optional[Iterable[str]] = None, key_backend_options: Optional[dict[str, dict[str, JSON]]] = None
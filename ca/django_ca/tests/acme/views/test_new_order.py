@@ -15,6 +15,7 @@
 
 # pylint: disable=redefined-outer-name  # because of fixtures
 
+from collections.abc import Iterator
 from datetime import timedelta, timezone as tz
 from http import HTTPStatus
 from typing import Any
@@ -27,6 +28,7 @@ from django.test import Client
 from django.utils import timezone
 
 import pytest
+from freezegun import freeze_time
 from pytest_django.fixtures import SettingsWrapper
 
 from django_ca.acme.messages import NewOrder
@@ -37,11 +39,27 @@ from django_ca.tests.acme.views.base import AcmeWithAccountViewTestCaseMixin
 from django_ca.tests.acme.views.constants import SERVER_NAME
 from django_ca.tests.acme.views.utils import absolute_acme_uri, acme_request
 from django_ca.tests.base.constants import TIMESTAMPS
-from django_ca.tests.base.utils import mock_slug, root_reverse
+from django_ca.tests.base.utils import json_loads, mock_slug, root_reverse
 
 # ACME views require a currently valid certificate authority
 now = TIMESTAMPS["everything_valid"]  # just a shortcut
-pytestmark = [pytest.mark.freeze_time(now)]
+
+IDENTIFIERS = [{"type": "dns", "value": SERVER_NAME}]
+
+# Under the frozen clock the expected expiry is constant, so compute both timezone variants once.
+EXPIRES = now + model_settings.CA_ACME_ORDER_VALIDITY
+EXPIRES_NAIVE = timezone.make_naive(EXPIRES, timezone=tz.utc)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def frozen_time() -> Iterator[None]:
+    """Freeze time for the whole module at once.
+
+    The usual freeze_time marker enters and exits freezegun for every test, each time scanning loaded modules
+    for date/time references. A module-scoped fixture pays that cost only once.
+    """
+    with freeze_time(now):
+        yield
 
 
 @pytest.fixture
@@ -50,10 +68,10 @@ def url() -> str:
     return root_reverse("acme-new-order")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def message() -> NewOrder:
-    """Default message sent to the server."""
-    return NewOrder(identifiers=[{"type": "dns", "value": SERVER_NAME}])
+    """Default message sent to the server (module-scoped, as josepy messages are immutable)."""
+    return NewOrder(identifiers=IDENTIFIERS)
 
 
 @pytest.mark.parametrize("use_tz", (True, False))
@@ -74,31 +92,31 @@ def test_basic(
         resp = acme_request(client, url, root, message, kid=kid)
     assert resp.status_code == HTTPStatus.CREATED, resp.content
 
-    expires = timezone.now() + model_settings.CA_ACME_ORDER_VALIDITY
-    assert resp.json() == {
+    # Compare timestamps as datetimes: parsing the response is cheaper than generating the expected string
+    # and removes the accept_naive branching. The response timestamp is always aware (in UTC).
+    resp_data = json_loads(resp.content)
+    assert pyrfc3339.parse(resp_data.pop("expires")) == EXPIRES
+    assert resp_data == {
         "authorizations": [absolute_acme_uri(":acme-authz", serial=root.serial, slug=slug)],
-        "expires": pyrfc3339.generate(expires, accept_naive=not use_tz),
         "finalize": absolute_acme_uri(":acme-order-finalize", serial=root.serial, slug=slug),
-        "identifiers": [{"type": "dns", "value": SERVER_NAME}],
+        "identifiers": IDENTIFIERS,
         "status": "pending",
     }
 
-    order = AcmeOrder.objects.get(account=account)
-    assert order.account == account
-    assert order.slug == slug
-    assert order.status == "pending"
-    assert order.expires == expires
-    assert order.not_before is None
-    assert order.not_after is None
-
-    # Test the autogenerated AcmeAuthorization object
-    authz = order.authorizations.all()
-    assert len(authz) == 1
-    assert authz[0].order == order
-    assert authz[0].type == "dns"
-    assert authz[0].value == SERVER_NAME
-    assert authz[0].status == AcmeAuthorization.STATUS_PENDING
-    assert authz[0].wildcard is False
+    # Load the order as a plain row and compare all fields at once (account is part of the filter already).
+    order = AcmeOrder.objects.values_list(
+        "pk", "slug", "status", "expires", "not_before", "not_after"
+    ).get(account=account)
+    assert order[1:] == (slug, "pending", EXPIRES if use_tz else EXPIRES_NAIVE, None, None)
+
+    # Test the autogenerated AcmeAuthorization object. values_list() yields plain rows in one query instead
+    # of hydrating model instances.
+    authz = list(
+        AcmeAuthorization.objects.filter(order=order[0]).values_list(
+            "order", "type", "value", "status", "wildcard"
+        )
+    )
+    assert authz == [(order[0], "dns", SERVER_NAME, AcmeAuthorization.STATUS_PENDING, False)]
 
 
 @pytest.mark.parametrize("use_tz", (True, False))
@@ -122,46 +140,43 @@ def test_not_before_not_after(
     if timezone.is_naive(not_after):
         not_after = timezone.make_aware(not_after, timezone=tz.utc)
 
-    msg = NewOrder(
-        identifiers=[{"type": "dns", "value": SERVER_NAME}], not_before=not_before, not_after=not_after
-    )
+    msg = NewOrder(identifiers=IDENTIFIERS, not_before=not_before, not_after=not_after)
 
     with mock_slug() as slug:
         resp = acme_request(client, url, root, msg, kid=kid)
     assert resp.status_code == HTTPStatus.CREATED, resp.content
 
-    expires = timezone.now() + model_settings.CA_ACME_ORDER_VALIDITY
-    assert resp.json() == {
+    # Compare timestamps as datetimes: parsing the response is cheaper than generating the expected string
+    # and removes the accept_naive branching. The response timestamps are always aware (in UTC).
+    resp_data = json_loads(resp.content)
+    assert pyrfc3339.parse(resp_data.pop("expires")) == EXPIRES
+    assert pyrfc3339.parse(resp_data.pop("notBefore")) == not_before
+    assert pyrfc3339.parse(resp_data.pop("notAfter")) == not_after
+    assert resp_data == {
         "authorizations": [absolute_acme_uri(":acme-authz", serial=root.serial, slug=slug)],
-        "expires": pyrfc3339.generate(expires, accept_naive=not use_tz),
         "finalize": absolute_acme_uri(":acme-order-finalize", serial=root.serial, slug=slug),
-        "identifiers": [{"type": "dns", "value": SERVER_NAME}],
+        "identifiers": IDENTIFIERS,
         "status": "pending",
-        "notBefore": pyrfc3339.generate(not_before, accept_naive=not use_tz),
-        "notAfter": pyrfc3339.generate(not_after, accept_naive=not use_tz),
     }
 
-    order = AcmeOrder.objects.get(account=account)
-    assert order.account == account
-    assert order.slug == slug
-    assert order.status == "pending"
-    assert order.expires == expires
-
-    if use_tz:
-        assert order.not_before == not_before
-        assert order.not_after == not_after
-    else:
-        assert order.not_before == timezone.make_naive(not_before)
-        assert order.not_after == timezone.make_naive(not_after)
-
-    # Test the autogenerated AcmeAuthorization object
-    authz = order.authorizations.all()
-    assert len(authz) == 1
-    assert authz[0].order == order
-    assert authz[0].type == "dns"
-    assert authz[0].value == SERVER_NAME
-    assert authz[0].status == AcmeAuthorization.STATUS_PENDING
-    assert authz[0].wildcard is False
+    if not use_tz:
+        not_before = timezone.make_naive(not_before)
+        not_after = timezone.make_naive(not_after)
+
+    # Load the order as a plain row and compare all fields at once (account is part of the filter already).
+    order = AcmeOrder.objects.values_list(
+        "pk", "slug", "status", "expires", "not_before", "not_after"
+    ).get(account=account)
+    assert order[1:] == (slug, "pending", EXPIRES if use_tz else EXPIRES_NAIVE, not_before, not_after)
+
+    # Test the autogenerated AcmeAuthorization object. values_list() yields plain rows in one query instead
+    # of hydrating model instances.
+    authz = list(
+        AcmeAuthorization.objects.filter(order=order[0]).values_list(
+            "order", "type", "value", "status", "wildcard"
+        )
+    )
+    assert authz == [(order[0], "dns", SERVER_NAME, AcmeAuthorization.STATUS_PENDING, False)]
 
 
 @pytest.mark.usefixtures("account")
@@ -200,7 +215,7 @@ def test_invalid_not_before_after(
     client: Client, url: str, root: CertificateAuthority, kid: str, values: dict[str, Any], expected: str
 ) -> None:
     """Test invalid not_before/not_after dates."""
-    message = NewOrder(identifiers=[{"type": "dns", "value": SERVER_NAME}], **values)
+    message = NewOrder(identifiers=IDENTIFIERS, **values)
     resp = acme_request(client, url, root, message, kid=kid)
     assert_malformed(resp, root, expected)
 
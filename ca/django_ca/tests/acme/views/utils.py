@@ -13,6 +13,7 @@
 
 """Utility functions for ACME."""
 
+import functools
 import json
 from http import HTTPStatus
 from typing import Any, Callable, Optional, Union, cast
@@ -31,10 +32,31 @@ from django_ca.tests.base.constants import CERT_DATA
 from django_ca.tests.base.typehints import HttpResponse
 
 
+@functools.lru_cache(maxsize=64)
+def _reverse(viewname: str, kwargs: tuple[tuple[str, Any], ...]) -> str:
+    """Cached version of :py:func:`~django.urls.reverse`, which traverses the URL resolver on every call.
+
+    ACME tests resolve the same handful of URLs in both requests and assertions, so cache them here. `kwargs`
+    is a tuple of items so that it is hashable.
+    """
+    return reverse(viewname, kwargs=dict(kwargs))
+
+
+@functools.lru_cache(maxsize=8)
+def _jwk(key: CertificateIssuerPrivateKeyTypes) -> jose.jwk.JWKRSA:
+    """Cached JWK wrapper for the given private key.
+
+    The wrapper is stateless, so requests signed with the same key (virtually all of them) can share it
+    instead of rebuilding it per request.
+    """
+    comparable = jose.util.ComparableRSAKey(key)  # type: ignore[arg-type] # could also be DSA/EC key
+    return jose.jwk.JWKRSA(key=comparable)
+
+
 def absolute_acme_uri(path: str, **kwargs: Any) -> str:
     """Override to set a default for `hostname`."""
     if path.startswith(":"):
-        path = reverse(f"django_ca{path}", kwargs=kwargs)
+        path = _reverse(f"django_ca{path}", tuple(sorted(kwargs.items())))
     return f"http://{SERVER_NAME}{path}"
 
 
@@ -89,8 +111,7 @@ def acme_request(
     if post_kwargs is None:
         post_kwargs = {}
 
-    comparable = jose.util.ComparableRSAKey(cert)  # type: ignore[arg-type] # could also be DSA/EC key
-    key = jose.jwk.JWKRSA(key=comparable)
+    key = _jwk(cert)
 
     if isinstance(msg, jose.json_util.JSONObjectWithFields):
         payload = msg.to_json()
@@ -86,12 +86,18 @@ class CSRDetailTestCase(CertificateModelAdminTestCaseMixin, TestCase):
     url = reverse("admin:django_ca_certificate_csr_details")
     csr_pem = CERT_DATA["root-cert"]["csr"]["parsed"].public_bytes(Encoding.PEM).decode("utf-8")
 
+    # Private key shared by all create_csr() calls. RSA key generation is by far the most expensive part of
+    # creating a CSR, and these tests only need *a* key, not a fresh one.
+    _csr_private_key: typing.ClassVar[typing.Optional[CertificateIssuerPrivateKeyTypes]] = None
+
     @classmethod
     def create_csr(
         cls, subject: x509.Name
     ) -> tuple[CertificateIssuerPrivateKeyTypes, x509.CertificateSigningRequest]:
         """Generate a CSR with the given subject."""
-        private_key = rsa.generate_private_key(public_exponent=65537, key_size=1024)
+        if cls._csr_private_key is None:
+            cls._csr_private_key = rsa.generate_private_key(public_exponent=65537, key_size=1024)
+        private_key = cls._csr_private_key
         builder = x509.CertificateSigningRequestBuilder()
 
         builder = builder.subject_name(subject)
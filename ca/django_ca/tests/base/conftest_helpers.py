@@ -193,6 +193,7 @@ def generate_usable_ca_fixture(name: str) -> typing.Callable[["SubRequest", Path
     def fixture(request: "SubRequest", tmpcadir: Path) -> CertificateAuthority:
         ca = request.getfixturevalue(name)  # load the CA into the database
         data = CERT_DATA[name]
+        # Really copy the file: tests may overwrite the key in the temporary directory.
         shutil.copy(os.path.join(FIXTURES_DIR, data["key_filename"]), tmpcadir)
 
         return ca  # type: ignore[no-any-return]
@@ -13,17 +13,18 @@
 
 """Define various constants for tests. These are exported via django_ca.tests.base."""
 
-import json
 import os
 import re
 import shutil
 import sys
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone as tz
 from importlib.metadata import version
 from pathlib import Path
 from typing import Any, cast
 
+import orjson
 import packaging.version
 
 import cryptography
@@ -101,9 +102,8 @@ NEWEST_VERSIONS = NEWEST_PYTHON and NEWEST_CRYPTOGRAPHY and NEWEST_DJANGO and NE
 # Only run Selenium tests if we use the newest Python, cryptography and acme.
 RUN_SELENIUM_TESTS = NEWEST_PYTHON and NEWEST_CRYPTOGRAPHY and NEWEST_ACME and NEWEST_PYDANTIC
 
-# Fixture data used by test cases
-with open(FIXTURES_DIR / "cert-data.json", encoding="utf-8") as cert_data_stream:
-    FIXTURES_DATA = json.load(cert_data_stream)
+# Fixture data used by test cases (orjson parses the large file considerably faster than the stdlib)
+FIXTURES_DATA = orjson.loads((FIXTURES_DIR / "cert-data.json").read_bytes())
 CERT_DATA = FIXTURES_DATA["certs"]
 
 
@@ -337,7 +337,7 @@ def _load_key(data: dict[Any, Any]) -> KeyDict:
 
 
 def _load_csr(data: dict[Any, Any]) -> CsrDict:
-    with open(FIXTURES_DIR / data["csr_filename"], "rb") as stream:
+    with open(data["csr_path"], "rb") as stream:
         raw = stream.read()
 
     parsed = x509.load_der_x509_csr(raw)
@@ -348,7 +348,7 @@ def _load_pub(data: dict[str, Any]) -> PubDict:
     with open(data["pub_path"], "rb") as stream:
         key_data = stream.read()
 
-    if _cert_data["cat"] == "sphinx-contrib":
+    if data["cat"] == "sphinx-contrib":
         parsed = x509.load_pem_x509_certificate(key_data)
         pem = key_data.decode("utf-8")
         der = parsed.public_bytes(Encoding.DER)
@@ -360,47 +360,91 @@ def _load_pub(data: dict[str, Any]) -> PubDict:
     return {"pem": pem, "parsed": parsed, "der": der}
 
 
-# Augment data with various pre-computed paths
-for _name, _cert_data in CERT_DATA.items():
-    if _cert_data["cat"] == "sphinx-contrib":
-        basedir = SPHINX_FIXTURES_DIR / _cert_data["type"]
+class _LazyCertData(dict[str, Any]):
+    """Data for a single cert entry that parses the private key and CSR only on first access.
+
+    Parsing key material is an expensive part of loading the fixtures and most test runs touch only a few
+    entries, so defer it until a test actually asks for it. Public keys are still loaded eagerly, as much of
+    the data in an entry (issuer, validity, extensions) is derived from them at import time.
+    """
+
+    def _is_lazy(self, key: str) -> bool:
+        if key == "key":
+            return bool(dict.get(self, "key_path"))
+        if key == "csr":
+            return bool(dict.get(self, "csr_path"))
+        return False
+
+    def __missing__(self, key: str) -> Any:
+        if key == "key" and self._is_lazy(key):
+            self["key"] = key_data = _load_key(self)
+            return key_data
+        if key == "csr" and self._is_lazy(key):
+            self["csr"] = csr_data = _load_csr(self)
+            return csr_data
+        raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return super().__contains__(key) or self._is_lazy(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+
+def _materialize(cert_data: dict[str, Any]) -> _LazyCertData:
+    """Augment a single cert-data.json entry with pre-computed paths and data from the public key."""
+    data = _LazyCertData(cert_data)
+    if data["cat"] == "sphinx-contrib":
+        basedir = SPHINX_FIXTURES_DIR / data["type"]
     else:
         basedir = FIXTURES_DIR
 
-    if _key_filename := _cert_data.get("key_filename"):
-        _cert_data["key_path"] = basedir / _cert_data["key_filename"]
-    if _password := _cert_data.get("password"):
-        _cert_data["password"] = _cert_data["password"].encode("utf-8")
-    _cert_data["pub_path"] = basedir / _cert_data["pub_filename"]
-
-    if _cert_data["type"] == "ca":
-        _cert_data.setdefault("children", [])
-        _cert_data["children"] = [(k, add_colons(v)) for k, v in _cert_data["children"]]
-
-    # Load data from files
-    if _cert_data.get("key_path"):
-        _cert_data["key"] = _load_key(_cert_data)
-    if _cert_data.get("csr_filename"):
-        _cert_data["csr"] = _load_csr(_cert_data)
-    _cert_data["pub"] = _load_pub(_cert_data)
-    _cert: x509.Certificate = _cert_data["pub"]["parsed"]
-
-    # Data derived from public key
-    _cert_data["issuer"] = _cert.issuer
-    _cert_data["serial_colons"] = add_colons(_cert_data["serial"])
-    _not_before = _cert.not_valid_before_utc
-    _not_after = _cert.not_valid_after_utc
-    _cert_data["not_before"] = _not_before
-    _cert_data["valid_until"] = _not_after
-    _cert_data["not_before_str"] = _cert_data["not_before"].isoformat(" ")
-    _cert_data["not_after_str"] = _cert_data["valid_until"].isoformat(" ")
-
-    for extension in _cert.extensions:
+    if key_filename := data.get("key_filename"):
+        data["key_path"] = basedir / key_filename
+    if csr_filename := data.get("csr_filename"):
+        data["csr_path"] = FIXTURES_DIR / csr_filename
+    if data.get("password"):
+        data["password"] = data["password"].encode("utf-8")
+    data["pub_path"] = basedir / data["pub_filename"]
+
+    if data["type"] == "ca":
+        data.setdefault("children", [])
+        data["children"] = [(k, add_colons(v)) for k, v in data["children"]]
+
+    # Load the public key from file ("key" and "csr" are loaded lazily by _LazyCertData)
+    data["pub"] = _load_pub(data)
+    cert: x509.Certificate = data["pub"]["parsed"]
+
+    # Data derived from public key, stored with a single update() call
+    not_before = cert.not_valid_before_utc
+    not_after = cert.not_valid_after_utc
+    data.update(
+        {
+            "issuer": cert.issuer,
+            "not_before": not_before,
+            "valid_until": not_after,
+            "not_before_str": not_before.isoformat(" "),
+            "not_after_str": not_after.isoformat(" "),
+        }
+    )
+    # Newer cert-data.json files already include serial_colons, only compute it for older ones.
+    data.setdefault("serial_colons", add_colons(data["serial"]))
+
+    for extension in cert.extensions:
         try:
             key = EXTENSION_KEYS[extension.oid]
         except KeyError:  # unknown extensions from StartSSL CA
             continue
-        _cert_data[key] = extension
+        data[key] = extension
+    return data
+
+
+# Entries are independent and cryptography releases the GIL for the ASN.1 parsing, so the certificates can
+# be loaded in a small thread pool.
+with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as _pool:
+    CERT_DATA = dict(zip(CERT_DATA, _pool.map(_materialize, list(CERT_DATA.values()))))
 
 # Calculate some fixed timestamps that we reuse throughout the tests
 TIMESTAMPS = {
@@ -14,35 +14,41 @@
 """Some common base classes for test cases."""
 
 import os
+import typing
 
 from django.contrib.staticfiles.testing import StaticLiveServerTestCase
 from django.test import TestCase
 from django.urls import reverse
 
-from pyvirtualdisplay import Display
-from selenium.webdriver import Firefox
-from selenium.webdriver.common.by import By
-from selenium.webdriver.firefox.service import Service
-from selenium.webdriver.firefox.webdriver import WebDriver
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.wait import WebDriverWait
-
 from django_ca.tests.base.constants import GECKODRIVER_LOG_PATH, GECKODRIVER_PATH
 from django_ca.tests.base.mixins import TestCaseMixin
 
+if typing.TYPE_CHECKING:
+    from pyvirtualdisplay import Display
+    from selenium.webdriver.firefox.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
 
 class SeleniumTestCase(TestCaseMixin, StaticLiveServerTestCase):  # pragma: no cover
     """TestCase with some helper functions for Selenium."""
 
     # NOTE: coverage has weird issues all over this class
-    virtual_display: Display
-    selenium: WebDriver
+    virtual_display: "Display"
+    selenium: "WebDriver"
 
     @classmethod
     def setUpClass(cls) -> None:
         super().setUpClass()
 
+        # Import here so that non-Selenium test runs don't pay for the large selenium dependency graph.
+        # pylint: disable=import-outside-toplevel
+        from selenium.webdriver import Firefox
+        from selenium.webdriver.firefox.service import Service
+        # pylint: enable=import-outside-toplevel
+
         if os.environ.get("VIRTUAL_DISPLAY") != "n":
+            from pyvirtualdisplay import Display  # pylint: disable=import-outside-toplevel
+
             cls.virtual_display = Display(visible=False, size=(1024, 768))
             cls.virtual_display.start()
 
@@ -57,17 +63,23 @@ class SeleniumTestCase(TestCaseMixin, StaticLiveServerTestCase):  # pragma: no c
 
         super().tearDownClass()
 
-    def find(self, selector: str) -> WebElement:
+    def find(self, selector: str) -> "WebElement":
         """Find an element by CSS selector."""
+        from selenium.webdriver.common.by import By  # pylint: disable=import-outside-toplevel
+
         return self.selenium.find_element(by=By.CSS_SELECTOR, value=selector)
 
-    def find_by_tag(self, tag: str) -> WebElement:
+    def find_by_tag(self, tag: str) -> "WebElement":
         """Find an element by its tag (e.g. "body")."""
+        from selenium.webdriver.common.by import By  # pylint: disable=import-outside-toplevel
+
         return self.selenium.find_element(by=By.TAG_NAME, value=tag)
 
     @classmethod
     def login(cls, username: str = "admin", password: str = "admin") -> None:
         """Login the given user."""
+        from selenium.webdriver.common.by import By  # pylint: disable=import-outside-toplevel
+
         cls.selenium.get(f"{cls.live_server_url}{reverse('admin:login')}")
         cls.selenium.find_element(By.ID, "id_username").send_keys(username)
         cls.selenium.find_element(By.ID, "id_password").send_keys(password)
@@ -77,6 +89,11 @@ class SeleniumTestCase(TestCaseMixin, StaticLiveServerTestCase):  # pragma: no c
     @classmethod
     def wait_for_page_load(cls, timeout: int = 2, poll_frequency: float = 0.1) -> None:
         """Wait for the page to load."""
+        # pylint: disable=import-outside-toplevel
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.wait import WebDriverWait
+        # pylint: enable=import-outside-toplevel
+
         WebDriverWait(cls.selenium, timeout, poll_frequency=poll_frequency).until(
             lambda driver: driver.find_element(by=By.TAG_NAME, value="body")
         )
@@ -27,6 +27,7 @@ from io import BytesIO, StringIO
 from typing import Any, Optional, Union
 from unittest import mock
 
+import orjson
 from pydantic import BaseModel
 
 from cryptography import x509
@@ -480,6 +481,11 @@ def issuer_alternative_name(
     )
 
 
+def json_loads(value: Union[bytes, str]) -> Any:
+    """Parse JSON with :py:func:`orjson.loads`, which is faster than the stdlib parser used by ``.json()``."""
+    return orjson.loads(value)
+
+
 def key_usage(**usages: bool) -> x509.Extension[x509.KeyUsage]:
     """Shortcut for getting a KeyUsage extension."""
     critical = usages.pop("critical", True)
@@ -602,7 +608,8 @@ class override_tmpcadir(override_settings):  # pylint: disable=invalid-name; in
         self.options["STORAGES"] = settings.STORAGES
         self.options["STORAGES"]["django-ca"]["OPTIONS"]["location"] = tmpdir
 
-        # copy CAs
+        # copy CAs. Note that the files must really be copied: some tests overwrite the key file in the
+        # temporary directory, and a hard link would corrupt the fixture in the source tree.
         for filename in [v["key_filename"] for v in CERT_DATA.values() if v["key_filename"] is not False]:
             shutil.copy(os.path.join(FIXTURES_DIR, filename), tmpdir)
 
@@ -24,6 +24,7 @@ import coverage
 
 from django.test import Client
 
+import freezegun
 import pytest
 from _pytest.config import Config as PytestConfig
 from _pytest.config.argparsing import Parser
@@ -46,6 +47,25 @@ from django_ca.tests.base.typehints import User
 
 # NOTE: Assertion rewrites are in __init__.py
 
+# freezegun inspects every module in sys.modules on each freeze_time() enter/exit to patch references to
+# date/time functions, which adds up across the suite. None of these libraries ever look at the wall clock,
+# so they can safely be skipped. Note that we cannot simply pass list(sys.modules), as modules that import
+# e.g. datetime.datetime directly may already be imported at this point and still need to be patched.
+freezegun.configure(  # type: ignore[attr-defined]  # not included in type stubs
+    extend_ignore_list=[
+        "coverage",
+        "cryptography",
+        "idna",
+        "OpenSSL",
+        "orjson",
+        "pydantic",
+        "pydantic_core",
+        "requests",
+        "urllib3",
+        "yaml",
+    ]
+)
+
 # Load fixtures from local "plugin":
 pytest_plugins = ["django_ca.tests.base.fixtures"]
 
@@ -0,0 +1,53 @@
+# This file is part of django-ca (https://github.com/mathiasertl/django-ca).
+#
+# django-ca is free software: you can redistribute it and/or modify it under the terms of the GNU General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# django-ca is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+# implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License
+# for more details.
+#
+# You should have received a copy of the GNU General Public License along with django-ca. If not, see
+# <http://www.gnu.org/licenses/>.
+
+"""Test the generate_ocsp_key_and_cache_crl task."""
+
+import logging
+from unittest import mock
+
+from django.core.files.storage import storages
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+from django_ca.conf import model_settings
+from django_ca.models import CertificateAuthority
+from django_ca.tasks import generate_ocsp_key_and_cache_crl
+from django_ca.tests.base.constants import TIMESTAMPS
+from django_ca.tests.tasks.conftest import assert_crls
+
+pytestmark = [
+    pytest.mark.freeze_time(TIMESTAMPS["everything_valid"]),
+    pytest.mark.usefixtures("clear_cache"),
+]
+
+
+def test_basic(usable_root: CertificateAuthority) -> None:
+    """Test the most basic invocation."""
+    generate_ocsp_key_and_cache_crl(usable_root.serial)
+    storage = storages[model_settings.CA_DEFAULT_STORAGE_ALIAS]
+    assert storage.exists(f"ocsp/{usable_root.serial}.key") is True
+    assert storage.exists(f"ocsp/{usable_root.serial}.pem") is True
+    assert_crls(usable_root)
+
+
+def test_with_ocsp_key_error(usable_root: CertificateAuthority, caplog: LogCaptureFixture) -> None:
+    """Test that the CRL is still cached if generating the OCSP key fails."""
+    with (
+        mock.patch("django_ca.tasks.generate_ocsp_key", side_effect=Exception("error")),
+        caplog.at_level(logging.INFO),
+    ):
+        generate_ocsp_key_and_cache_crl(usable_root.serial)
+    assert "Error creating OCSP responder key for" in caplog.text
+    assert_crls(usable_root)
@@ -497,8 +497,7 @@ class GenericOCSPView(OCSPView):
         return now + timedelta(seconds=self.auto_ca.ocsp_response_validity)
 
     def get_responder_key_data(self) -> bytes:
-        serial = self.auto_ca.serial.replace(":", "")
-        return read_file(f"ocsp/{serial}.key")
+        return read_file(f"ocsp/{self.auto_ca.safe_serial}.key")
 
     def get_responder_cert(self) -> x509.Certificate:
         return self.auto_ca.ocsp_responder_certificate
@@ -206,7 +206,21 @@ def add_subcommands(parser: argparse.ArgumentParser, path: str, dest: str = "com
     module = importlib.import_module(path)
     submodules = pkgutil.iter_modules(module.__path__)
 
-    for _finder, name, _is_pkg in submodules:
+    # Peek at the command line to find the chosen subcommand, so that only its module has to be imported and
+    # only its parser has to be fully built. Some submodules have heavy transitive imports (Docker, requests,
+    # cryptography, ...) that every invocation would otherwise pay for. When help output is requested (which
+    # shows the help text of every subcommand) or no subcommand matches, fall back to building everything.
+    names = {name: name.replace("_", "-") for _finder, name, _is_pkg in submodules}
+    chosen: Optional[str] = None
+    if not any(arg in ("-h", "--help") for arg in sys.argv[1:]):
+        chosen = next((arg for arg in sys.argv[1:] if arg in names.values()), None)
+
+    for name, arg_name in names.items():
+        if chosen is not None and arg_name != chosen:
+            # Register a stub so that argparse recognizes the token; the stub is never executed.
+            commands.add_parser(arg_name)
+            continue
+
         # Import module
         submodule = importlib.import_module(f"{path}.{name}")
 
@@ -218,13 +232,12 @@ def add_subcommands(parser: argparse.ArgumentParser, path: str, dest: str = "com
         # Instantiate command class and add its arguments
         command = command_cls(parser=parser, **kwargs)
 
-        name = name.replace("_", "-")
         description = command.description
         if not description:
             description = command.help_text
 
         subcommand_parser = commands.add_parser(
-            name, help=command.help_text, description=description, parents=command.parser_parents
+            arg_name, help=command.help_text, description=description, parents=command.parser_parents
         )
         subcommand_parser.set_defaults(func=command.exec)
         command.add_arguments(subcommand_parser)
@@ -57,7 +57,7 @@ from django_ca.pydantic.extensions import (
 )
 from django_ca.tests.base.typehints import CertFixtureData, OcspFixtureData
 from django_ca.typehints import ParsableKeyType
-from django_ca.utils import bytes_to_hex, parse_serialized_name_attributes, serialize_name
+from django_ca.utils import add_colons, bytes_to_hex, parse_serialized_name_attributes, serialize_name
 
 DEFAULT_KEY_SIZE = 2048  # Size for private keys
 TIMEFORMAT = "%Y-%m-%d %H:%M:%S"
@@ -127,6 +127,7 @@ def _create_csr(
 
 def _update_cert_data(cert: Union[CertificateAuthority, Certificate], data: dict[str, Any]) -> None:
     data["serial"] = cert.serial
+    data["serial_colons"] = add_colons(cert.serial)
     data["sha256"] = cert.get_fingerprint(hashes.SHA256())
     data["sha512"] = cert.get_fingerprint(hashes.SHA512())
     data["extensions"] = cert.pub.loaded.extensions
@@ -193,6 +194,7 @@ def _update_contrib(
         "key_filename": False,
         "csr_filename": False,
         "serial": cert.serial,
+        "serial_colons": add_colons(cert.serial),
         "subject": serialize_name(cert.subject),
         "md5": cert.get_fingerprint(hashes.MD5()),
         "sha1": cert.get_fingerprint(hashes.SHA1()),
@@ -13,34 +13,35 @@
 
 """Sphinx configuration."""
 
+import importlib.util
 import os
 import sys
 from datetime import date
+from pathlib import Path
 from typing import Any
 
-import sphinx_rtd_theme
 from sphinx.addnodes import document, pending_xref
 from sphinx.application import Sphinx
 
-try:
-    from sphinxcontrib import spelling
-except ImportError:
-    spelling = None
+# Only probe for sphinxcontrib-spelling instead of importing it: the import loads the enchant C library,
+# which the spelling builder does on its own when it actually runs. The import of the spelling filters
+# below still guards against ImportError, as pyenchant may be installed without the enchant C library.
+_HAVE_SPELLING = importlib.util.find_spec("sphinxcontrib.spelling") is not None
 
 
-sys.path.insert(0, os.path.dirname(__file__))
-
 # If extensions (or modules to document with autodoc) are in another directory,
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 # sys.path.insert(0, os.path.abspath('.'))
 
-_BASE_DIR = os.path.dirname(os.path.abspath(__name__))
-_ROOT_DIR = os.path.dirname(os.path.dirname(_BASE_DIR))
-_SRC_DIR = os.path.join(_ROOT_DIR, "ca")
-_FIXTURES = os.path.join(_SRC_DIR, "django_ca", "tests", "fixtures")
-sys.path.insert(0, _SRC_DIR)
-sys.path.insert(0, _ROOT_DIR)
+_BASE_DIR = Path(__file__).resolve().parent
+_ROOT_DIR = _BASE_DIR.parents[1]
+_SRC_DIR = _ROOT_DIR / "ca"
+_FIXTURES = _SRC_DIR / "django_ca" / "tests" / "fixtures"
+# Skip paths that are already present so that re-imports (e.g. in parallel builds) don't grow sys.path.
+for _path in (str(_BASE_DIR), str(_SRC_DIR), str(_ROOT_DIR)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ca.settings")
 
 import django  # NOQA: E402
@@ -98,13 +99,16 @@ extensions = [
     "django_ca_sphinx",
 ]
 
-if spelling is not None:
-    from django_ca_sphinx.spelling import URIFilter, MagicWordsFilter, TypeHintsFilter  # isort:skip
-
-    extensions.append("sphinxcontrib.spelling")
-    spelling_exclude_patterns = ["**/generated/*.rst"]
-    spelling_filters = [URIFilter, MagicWordsFilter, TypeHintsFilter]
-    # spelling_show_suggestions = True
+if _HAVE_SPELLING:
+    try:
+        from django_ca_sphinx.spelling import URIFilter, MagicWordsFilter, TypeHintsFilter  # isort:skip
+    except ImportError:  # pyenchant is installed, but the enchant C library is missing
+        _HAVE_SPELLING = False
+    else:
+        extensions.append("sphinxcontrib.spelling")
+        spelling_exclude_patterns = ["**/generated/*.rst"]
+        spelling_filters = [URIFilter, MagicWordsFilter, TypeHintsFilter]
+        # spelling_show_suggestions = True
 
 numpydoc_show_class_members = False
 autodoc_inherit_docstrings = False
@@ -351,6 +355,8 @@ texinfo_documents = [
 # If true, do not generate a @detailmenu in the "Top" node's menu.
 # texinfo_no_detailmenu = False
 
+# NOTE: Must stay a list, Sphinx warns about config values whose type differs from the default (and the
+# docs build runs with -W).
 autodoc_mock_imports = [
     "OpenSSL",
     "acme",
@@ -382,12 +388,14 @@ rst_epilog = f"""
 .. _RFC 5280: https://datatracker.ietf.org/doc/html/rfc5280
 """
 
+# The theme is registered via its entry point, so Sphinx only imports it for builders that use it.
 html_theme = "sphinx_rtd_theme"
-html_theme_path = [sphinx_rtd_theme.get_html_theme_path()]
 
 # reusable variables for contexts below
 _ca_default_hostname = "ca.example.com"
 _tls_cert_root = "/etc/certs/"
+_manage_in_docker_compose = "docker compose exec backend manage"
+_docker_compose_path = "~/ca/"
 
 # Jinja template contexts
 jinja_contexts = {
@@ -401,11 +409,11 @@ jinja_contexts = {
     },
     "manage-as-py": {"manage": "python manage.py"},
     "manage-in-docker-compose": {
-        "manage": "docker compose exec backend manage",
+        "manage": _manage_in_docker_compose,
         "shared": True,
         "console_include": "/include/quickstart_with_docker_compose/setup-cas.yaml",
         "context": "quickstart-with-docker-compose",
-        "path": "~/ca/",
+        "path": _docker_compose_path,
     },
     "manage-from-source": {"manage": "django-ca"},
     "requirements-as-py": {},
@@ -461,8 +469,8 @@ jinja_contexts = {
         "ca_url_path": "",
         "shared": True,
         "guide": "with-docker-compose",
-        "manage": "docker compose exec backend manage",
-        "path": "~/ca/",
+        "manage": _manage_in_docker_compose,
+        "path": _docker_compose_path,
     },
 }
 jinja_globals = {"version": version, "last_version": str(get_last_version())}
@@ -496,7 +504,7 @@ qualname_overrides = {
 }
 
 # Ignore (not so important) classes where the documented name does not match the documented name.
-nitpick_ignore = [
+nitpick_ignore = (
     ("py:class", "NoneType"),
     # TypeVars for classes that make no sense in documenting.
     ("py:class", "django_ca.key_backends.base.CreatePrivateKeyOptionsTypeVar"),
@@ -516,7 +524,7 @@ nitpick_ignore = [
     ("py:class", "pytest_django.fixtures.SettingsWrapper"),
     # Pydantic root model signature does not currently work
     ("py:class", "RootModelRootType"),
-]
+)
 
 
 # NOINSPECTION NOTE: app is passed by the caller, but we don't need it.
@@ -540,18 +548,23 @@ def resolve_canonical_names(app: Sphinx, doctree: document) -> None:
         * https://stackoverflow.com/a/62301461 - source of this hack
 
     """
-    pending_xrefs = doctree.traverse(condition=pending_xref)
-    for node in pending_xrefs:
+    overrides = qualname_overrides  # local binding, as this function runs for every doctree
+    # findall() is the iterator variant of traverse(), avoiding the intermediate node list.
+    for node in doctree.findall(pending_xref):
         alias = node.get("reftarget", None)
 
-        if alias is not None and alias in qualname_overrides:
+        if alias is not None and (target := overrides.get(alias)) is not None:
             # This does set the type to attr in the error message, but does not fix the build error with
             # typehints described in nitpick_ignore either:
             # if alias == "KeyUsages":
             #     node["reftype"] = "attr"
-            node["reftarget"] = qualname_overrides[alias]
+            node["reftarget"] = target
 
 
-def setup(app: Sphinx) -> None:
+def setup(app: Sphinx) -> dict[str, bool]:
     """Add hook functions to Sphinx hooks."""
     app.connect("doctree-read", resolve_canonical_names)
+    # conf.py acts as an extension itself; without this metadata Sphinx assumes it is not parallel-safe and
+    # refuses to read/write documents in parallel (-j auto). resolve_canonical_names() only mutates the
+    # doctree it is given and treats qualname_overrides as read-only.
+    return {"parallel_read_safe": True, "parallel_write_safe": True}